@@ -3,83 +3,209 @@
 import os
 import sys
 import json
-import time
+import atexit
+import signal
+import threading
 import argparse
-from src.core.blockchain import Blockchain
-import firebase_admin
-from firebase_admin import auth, credentials
+import functools
+from src.core import fast_pow
+from src.core.chain_writer import ChainWriter
+from src.core.blockchain_store import BlockchainStore, load_blockchain
+from src.utils import crypto_utils
 
-cred = credentials.Certificate("serviceAccountKey.json")  # Download dari Firebase Console
-firebase_admin.initialize_app(cred)
+@functools.lru_cache(maxsize=1)
+def _firebase_app():
+    """
+    Inisialisasi aplikasi Firebase saat pertama kali dibutuhkan.
+    
+    Returns:
+        Aplikasi Firebase, atau None jika serviceAccountKey.json tidak ada
+    """
+    if not os.path.exists("serviceAccountKey.json"):
+        return None
+    
+    import firebase_admin
+    from firebase_admin import credentials
+    
+    cred = credentials.Certificate("serviceAccountKey.json")  # Download dari Firebase Console
+    return firebase_admin.initialize_app(cred)
 
 def verify_firebase_token(id_token: str):
+    from fastapi import HTTPException
+    
+    app = _firebase_app()
+    if app is None:
+        raise HTTPException(status_code=503, detail="Autentikasi Firebase tidak dikonfigurasi")
+    
     try:
-        decoded_token = auth.verify_id_token(id_token)
+        from firebase_admin import auth
+        decoded_token = auth.verify_id_token(id_token, app=app)
         uid = decoded_token['uid']
         return uid
     except Exception as e:
         raise HTTPException(status_code=401, detail="Token tidak valid")
 
-def main():
-    parser = argparse.ArgumentParser(description='Mining Ghalbir Blockchain')
-    parser.add_argument('--address', type=str, required=True, help='Alamat wallet untuk menerima reward')
-    parser.add_argument('--blockchain-file', type=str, help='File blockchain')
-    parser.add_argument('--blocks', type=int, help='Jumlah blok yang akan di-mining')
-    parser.add_argument('--auto', action='store_true', help='Mode mining otomatis')
-    args = parser.parse_args()
+def mine_block(blockchain, address):
+    """
+    Mining satu blok menggunakan proof of work dari src.core.fast_pow.
     
-    blockchain_file = args.blockchain_file or 'blockchain.json'
+    Args:
+        blockchain: Objek blockchain
+        address: Alamat wallet untuk menerima reward
+        
+    Returns:
+        Blok baru yang ditambahkan
+    """
+    return blockchain.mine_pending_transactions(address)
+
+def on_pending_change(blockchain, callback):
+    """
+    Mendaftarkan callback yang dipanggil setiap kali transaksi tertunda bertambah.
     
-    # Inisialisasi blockchain
-    if os.path.exists(blockchain_file):
-        blockchain = Blockchain.load_from_file(blockchain_file)
-    else:
-        blockchain = Blockchain()
+    Args:
+        blockchain: Objek blockchain
+        callback: Fungsi tanpa argumen yang dipanggil setelah transaksi diterima
+    """
+    add_transaction = blockchain.add_transaction
+    
+    def add_transaction_and_notify(transaction):
+        added = add_transaction(transaction)
+        if added:
+            callback()
+        return added
     
-    # Mining
+    blockchain.add_transaction = add_transaction_and_notify
+
+def mine_once(args, blockchain, writer):
+    """
+    Menjalankan satu sesi mining sesuai argumen dan menampilkan saldo.
+    
+    Args:
+        args: Argumen mining (address, blocks, auto)
+        blockchain: Objek blockchain
+        writer: ChainWriter untuk menyimpan blok baru
+    """
     if args.blocks:
         # Mining sejumlah blok tertentu
         for i in range(args.blocks):
             print(f"Mining blok {i+1}/{args.blocks}...")
-            block = blockchain.mine_pending_transactions(args.address)
+            block = mine_block(blockchain, args.address)
             print(f"Blok berhasil di-mining! Hash: {block.hash}")
             
             # Simpan blockchain
-            blockchain.save_to_file(blockchain_file)
+            writer.append(block)
     elif args.auto:
         # Mining otomatis
         try:
             print("Memulai mining otomatis. Tekan Ctrl+C untuk berhenti.")
+            
+            # Transaksi baru membangunkan loop segera; tanpa transaksi, blok
+            # tetap di-mining setiap 10 detik seperti sebelumnya
+            pending_tx_event = threading.Event()
+            on_pending_change(blockchain, pending_tx_event.set)
+            pending_tx_event.set()
+            
             while True:
-                # Tambahkan transaksi dummy jika tidak ada transaksi tertunda
-                if len(blockchain.pending_transactions) == 0:
-                    from src.core.transaction import Transaction
-                    tx = Transaction("0x0", args.address, 0)
-                    blockchain.add_transaction(tx)
+                pending_tx_event.wait(timeout=10)
+                pending_tx_event.clear()
                 
                 print("Mining blok...")
-                block = blockchain.mine_pending_transactions(args.address)
+                block = mine_block(blockchain, args.address)
                 print(f"Blok berhasil di-mining! Hash: {block.hash}")
                 
                 # Simpan blockchain
-                blockchain.save_to_file(blockchain_file)
-                
-                # Tunggu sebentar
-                time.sleep(10)
+                writer.append(block)
         except KeyboardInterrupt:
             print("\nMining dihentikan.")
     else:
         # Mining satu blok
         print("Mining blok...")
-        block = blockchain.mine_pending_transactions(args.address)
+        block = mine_block(blockchain, args.address)
         print(f"Blok berhasil di-mining! Hash: {block.hash}")
         
         # Simpan blockchain
-        blockchain.save_to_file(blockchain_file)
+        writer.append(block)
     
     # Tampilkan saldo
     balance = blockchain.get_balance(args.address)
     print(f"Saldo: {balance} GBR")
 
+def serve(args, blockchain, writer):
+    """
+    Menjalankan perintah dari stdin tanpa memulai ulang proses.
+    
+    Perintah yang didukung:
+        mine <alamat> [jumlah_blok]
+        balance <alamat>
+        exit
+    
+    Args:
+        args: Argumen command line
+        blockchain: Objek blockchain
+        writer: ChainWriter untuk menyimpan blok baru
+    """
+    for line in sys.stdin:
+        parts = line.split()
+        if not parts:
+            continue
+        
+        cmd = parts[0].lower()
+        if cmd == 'exit':
+            break
+        elif cmd == 'mine' and (len(parts) == 2 or (len(parts) == 3 and parts[2].isdigit() and int(parts[2]) >= 1)):
+            blocks = int(parts[2]) if len(parts) == 3 else None
+            mine_args = argparse.Namespace(**{**vars(args), 'address': parts[1], 'blocks': blocks, 'auto': False})
+            mine_once(mine_args, blockchain, writer)
+        elif cmd == 'balance' and len(parts) == 2:
+            balance = blockchain.get_balance(parts[1])
+            print(f"Saldo: {balance} GBR")
+        else:
+            print(f"Perintah tidak dikenal: {line.strip()}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Mining Ghalbir Blockchain')
+    parser.add_argument('--address', type=str, help='Alamat wallet untuk menerima reward')
+    parser.add_argument('--blockchain-file', type=str, help='File blockchain')
+    parser.add_argument('--blocks', type=int, help='Jumlah blok yang akan di-mining')
+    parser.add_argument('--auto', action='store_true', help='Mode mining otomatis')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Jumlah proses untuk pencarian nonce')
+    parser.add_argument('--numba', action='store_true', help='Gunakan kernel Numba untuk pencarian nonce')
+    parser.add_argument('--save-every', '--checkpoint-interval', dest='save_every', type=int, default=100, help='Jumlah blok di antara dua penyimpanan file blockchain lengkap')
+    parser.add_argument('--sync-interval', type=float, default=60, help='Interval (detik) flush dan fsync log blok ke disk')
+    parser.add_argument('--serve', action='store_true', help='Tetap berjalan dan baca perintah dari stdin (mine, balance, exit)')
+    args = parser.parse_args()
+    
+    if not args.serve and not args.address:
+        parser.error('--address wajib diisi kecuali dengan --serve')
+    
+    blockchain_file = args.blockchain_file or 'blockchain.json'
+    
+    # Gunakan proof of work yang dipercepat, termasuk untuk blok genesis
+    if args.numba:
+        # Kernel Numba sudah paralel melalui thread, tanpa pool proses
+        from src.core import pow_numba
+        crypto_utils.proof_of_work = pow_numba.proof_of_work
+    elif args.workers > 1:
+        miner = fast_pow.ParallelMiner(args.workers)
+        atexit.register(miner.close)
+        crypto_utils.proof_of_work = miner.proof_of_work
+    else:
+        crypto_utils.proof_of_work = fast_pow.proof_of_work
+    
+    # Inisialisasi blockchain
+    blockchain = load_blockchain(blockchain_file)
+    
+    # Blok baru dicatat ke log; file lengkap ditulis berkala dan saat keluar
+    writer = ChainWriter(blockchain, blockchain_file, args.save_every, BlockchainStore(blockchain_file), args.sync_interval)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    try:
+        if args.serve:
+            serve(args, blockchain, writer)
+        else:
+            mine_once(args, blockchain, writer)
+    finally:
+        writer.close()
+
 if __name__ == '__main__':
     main()
@@ -1,37 +1,36 @@
 #!/usr/bin/env python3
 
-import os
 import sys
-import json
 import argparse
-from src.core.blockchain import Blockchain
+from src.core.config import load_config
+from src.core.blockchain_store import load_blockchain
+from src.network.shared_blockchain import connect_blockchain
 from src.vm.virtual_machine import VirtualMachine
 from src.api.metamask_api import MetaMaskAPI
+from src.api.asgi_server import serve
 
 def main():
     parser = argparse.ArgumentParser(description='Jalankan API Ghalbir Blockchain')
     parser.add_argument('--host', type=str, help='Host untuk menjalankan API')
     parser.add_argument('--port', type=int, help='Port untuk menjalankan API')
     parser.add_argument('--blockchain-file', type=str, help='File blockchain')
+    parser.add_argument('--rpc-socket', type=str, help='UNIX socket blockchain yang dibagikan oleh run_node.py')
     parser.add_argument('--verbose', action='store_true', help='Mode verbose')
     args = parser.parse_args()
     
     # Baca konfigurasi
-    config = {}
-    if os.path.exists('config.json'):
-        with open('config.json', 'r') as f:
-            config = json.load(f)
+    cfg = load_config('config.json')
     
     # Gunakan argumen command line jika ada, jika tidak gunakan konfigurasi
-    host = args.host or config.get('api', {}).get('host', '0.0.0.0')
-    port = args.port or config.get('api', {}).get('port', 8545)
+    host = args.host or cfg.api_host
+    port = args.port or cfg.api_port
     blockchain_file = args.blockchain_file or 'blockchain.json'
     
-    # Inisialisasi blockchain
-    if os.path.exists(blockchain_file):
-        blockchain = Blockchain.load_from_file(blockchain_file)
+    # Inisialisasi blockchain, gunakan milik node jika tersedia
+    if args.rpc_socket:
+        blockchain = connect_blockchain(args.rpc_socket)
     else:
-        blockchain = Blockchain()
+        blockchain = load_blockchain(blockchain_file)
     
     # Inisialisasi VM
     vm = VirtualMachine(blockchain)
@@ -41,8 +40,8 @@ def main():
     
     print(f"Memulai API Ghalbir Blockchain di {host}:{port}")
     
-    # Mulai API
-    api.start(host=host, port=port)
+    # Mulai API dengan server ASGI
+    serve(api, host=host, port=port)
 
 if __name__ == '__main__':
     main()
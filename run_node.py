@@ -2,10 +2,74 @@
 
 import os
 import sys
-import json
+import signal
 import argparse
+import selectors
+import threading
 from src.network.node import Node
+from src.core.config import load_config
 from src.core.blockchain import Blockchain
+from src.network.shared_blockchain import serve_blockchain, synchronized
+
+PROMPT = "Masukkan 'exit' untuk keluar: "
+
+def wait_for_exit(stop_event):
+    """
+    Menunggu perintah 'exit' dari stdin atau sinyal berhenti.
+    
+    Stdin dipantau dengan selector dan timeout 1 detik sehingga sinyal
+    berhenti selalu diperiksa. Jika stdin ditutup atau tidak ada (mis.
+    berjalan sebagai service), node tetap berjalan sampai sinyal berhenti
+    diterima.
+    
+    Args:
+        stop_event: Event yang di-set untuk menghentikan node
+    """
+    # sys.stdin bernilai None jika file descriptor 0 ditutup saat proses dimulai
+    try:
+        fd = sys.stdin.fileno()
+    except (AttributeError, ValueError, OSError):
+        while not stop_event.wait(timeout=1):
+            pass
+        return
+    
+    selector = selectors.DefaultSelector()
+    stdin_open = True
+    
+    # File biasa (mis. /dev/null) tidak dapat dipantau epoll, tetapi selalu siap dibaca
+    try:
+        selector.register(fd, selectors.EVENT_READ)
+        pollable = True
+    except PermissionError:
+        pollable = False
+    buffered = b''
+    
+    print(PROMPT, end='', flush=True)
+    while not stop_event.is_set():
+        if not stdin_open:
+            stop_event.wait(timeout=1)
+            continue
+        
+        if pollable and not selector.select(timeout=1):
+            continue
+        
+        data = os.read(fd, 4096)
+        if not data:
+            # Baris terakhir tanpa newline tetap diperiksa, seperti input()
+            if buffered.strip().lower() == b'exit':
+                return
+            
+            if pollable:
+                selector.unregister(fd)
+            stdin_open = False
+            continue
+        
+        buffered += data
+        *lines, buffered = buffered.split(b'\n')
+        for line in lines:
+            if line.strip().lower() == b'exit':
+                return
+            print(PROMPT, end='', flush=True)
 
 def main():
     parser = argparse.ArgumentParser(description='Jalankan node Ghalbir Blockchain')
@@ -13,20 +77,18 @@ def main():
     parser.add_argument('--port', type=int, help='Port untuk menjalankan node')
     parser.add_argument('--difficulty', type=int, help='Tingkat kesulitan untuk proof of work')
     parser.add_argument('--mining-reward', type=int, help='Reward untuk mining')
+    parser.add_argument('--rpc-socket', type=str, help='UNIX socket untuk membagikan blockchain ke proses lain (mis. run_api.py)')
     parser.add_argument('--verbose', action='store_true', help='Mode verbose')
     args = parser.parse_args()
     
     # Baca konfigurasi
-    config = {}
-    if os.path.exists('config.json'):
-        with open('config.json', 'r') as f:
-            config = json.load(f)
+    cfg = load_config('config.json')
     
     # Gunakan argumen command line jika ada, jika tidak gunakan konfigurasi
-    host = args.host or config.get('node', {}).get('host', '0.0.0.0')
-    port = args.port or config.get('node', {}).get('port', 5000)
-    difficulty = args.difficulty or config.get('node', {}).get('difficulty', 4)
-    mining_reward = args.mining_reward or config.get('node', {}).get('mining_reward', 50)
+    host = args.host or cfg.node_host
+    port = args.port or cfg.node_port
+    difficulty = args.difficulty or cfg.node_difficulty
+    mining_reward = args.mining_reward or cfg.node_mining_reward
     
     # Inisialisasi blockchain
     blockchain = Blockchain(difficulty=difficulty, mining_reward=mining_reward)
@@ -36,22 +98,34 @@ def main():
     node.blockchain = blockchain
     
     # Tambahkan peer dari konfigurasi
-    for peer in config.get('node', {}).get('peers', []):
+    for peer in cfg.node_peers:
         node.add_peer(peer)
     
+    # Hentikan node dengan rapi saat menerima SIGTERM (systemd/docker); dipasang
+    # sebelum socket RPC dan node dimulai agar sinyal awal tidak membunuh proses
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+    
     print(f"Memulai node Ghalbir Blockchain di {host}:{port}")
     print(f"Tingkat kesulitan: {difficulty}")
     print(f"Mining reward: {mining_reward}")
     
+    # Bagikan blockchain node ke proses lain di host yang sama
+    if args.rpc_socket:
+        # Pesan dari peer dan permintaan RPC tidak boleh mengubah blockchain bersamaan
+        lock = threading.RLock()
+        node.process_message = synchronized(lock, node.process_message)
+        node.replace_chain = synchronized(lock, node.replace_chain)
+        
+        serve_blockchain(lambda: node.blockchain, args.rpc_socket, lock)
+        print(f"Blockchain dibagikan melalui {args.rpc_socket}")
+    
     # Mulai node
     node.start()
     
     try:
         # Jaga agar program tetap berjalan
-        while True:
-            cmd = input("Masukkan 'exit' untuk keluar: ")
-            if cmd.lower() == 'exit':
-                break
+        wait_for_exit(stop_event)
     except KeyboardInterrupt:
         print("\nMenghentikan node...")
     finally:
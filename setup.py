@@ -8,8 +8,14 @@ setup(
         "ecdsa",
         "flask",
         "cryptography",
-        "web3",
+        "orjson",
+        "starlette",
+        "uvicorn[standard]",
     ],
+    extras_require={
+        'api': ['web3'],
+        'numba': ['numba', 'numpy'],
+    },
     entry_points={
         'console_scripts': [
             'ghalbir-node=run_node:main',
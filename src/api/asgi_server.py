@@ -0,0 +1,61 @@
+import threading
+import orjson
+import uvicorn
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+class ORJSONResponse(JSONResponse):
+    """
+    Response JSON yang diserialisasi dengan orjson.
+    """
+    def render(self, content):
+        return orjson.dumps(content)
+
+def create_app(api):
+    """
+    Membuat aplikasi ASGI untuk endpoint JSON-RPC MetaMaskAPI.
+
+    Route dan format response sama dengan server Flask bawaan MetaMaskAPI
+    (POST /api), sehingga MetaMask dan antarmuka web tidak perlu diubah.
+
+    Args:
+        api: Objek MetaMaskAPI
+
+    Returns:
+        Aplikasi Starlette
+    """
+    # State blockchain tidak thread-safe, sehingga request diproses satu per satu
+    lock = threading.Lock()
+
+    def process(request_data):
+        with lock:
+            return api.process_jsonrpc(request_data)
+
+    async def jsonrpc(request):
+        # Terima request JSON-RPC
+        try:
+            request_data = orjson.loads(await request.body())
+        except orjson.JSONDecodeError:
+            return ORJSONResponse(api.jsonrpc_error(-32700, "Parse error"))
+
+        # Proses request di threadpool agar panggilan yang lambat (mis. IPC
+        # melalui --rpc-socket) tidak menghentikan event loop
+        response = await run_in_threadpool(process, request_data)
+
+        # Kirim response
+        return ORJSONResponse(response)
+
+    return Starlette(routes=[Route('/api', jsonrpc, methods=['POST'])])
+
+def serve(api, host='0.0.0.0', port=8545):
+    """
+    Menjalankan API dengan uvicorn.
+
+    Args:
+        api: Objek MetaMaskAPI
+        host: Host untuk menjalankan server
+        port: Port untuk menjalankan server
+    """
+    uvicorn.run(create_app(api), host=host, port=port, loop='auto', http='auto')
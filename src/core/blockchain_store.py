@@ -0,0 +1,321 @@
+import contextlib
+import fcntl
+import mmap
+import os
+import struct
+from .block import Block
+from .blockchain import Blockchain
+from .transaction import Transaction
+from .chain_writer import replay_log
+from ..utils.file_utils import open_chain
+from ..utils.json_utils import dumps, loads
+
+# Satu record indeks per blok: offset, panjang, indeks blok, timestamp
+RECORD = struct.Struct('<QQQQ')
+
+def store_filenames(filename):
+    """
+    Mendapatkan nama file store untuk file blockchain.
+
+    Args:
+        filename: Nama file blockchain
+
+    Returns:
+        Tuple (file data, file indeks, file state)
+    """
+    base = os.path.splitext(filename)[0]
+    return base + '.dat', base + '.idx', base + '.state'
+
+class LazyChain:
+    """
+    Daftar blok yang didekode dari file data ter-mmap hanya saat diakses.
+    """
+    def __init__(self, data, index, length):
+        """
+        Inisialisasi rantai lazy.
+
+        Args:
+            data: mmap dari file data
+            index: mmap dari file indeks
+            length: Jumlah blok yang tersimpan
+        """
+        self._data = memoryview(data)
+        self._index = index
+        self._length = length
+        self._decoded = {}
+        self._appended = []
+
+    def _decode(self, i):
+        if i not in self._decoded:
+            offset, length, _, _ = RECORD.unpack_from(self._index, i * RECORD.size)
+            self._decoded[i] = Block.from_dict(loads(self._data[offset:offset + length]))
+        return self._decoded[i]
+
+    def __len__(self):
+        return self._length + len(self._appended)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('chain index out of range')
+
+        if i < self._length:
+            return self._decode(i)
+        return self._appended[i - self._length]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(self, block):
+        self._appended.append(block)
+
+class BlockchainStore:
+    """
+    Penyimpanan blockchain append-only yang dapat dimuat dengan mmap.
+
+    Blok disimpan berurutan di file data dengan indeks record berukuran tetap,
+    sedangkan state lain (saldo, transaksi tertunda, dst.) disimpan terpisah.
+    Store merupakan cache dari file blockchain JSON dan hanya dipakai jika
+    masih sesuai dengan file tersebut.
+    """
+    def __init__(self, filename):
+        """
+        Inisialisasi store.
+
+        Args:
+            filename: Nama file blockchain JSON
+        """
+        self.filename = filename
+        self.data_file, self.index_file, self.state_file = store_filenames(filename)
+        self.lock_file = os.path.splitext(filename)[0] + '.lock'
+
+    @contextlib.contextmanager
+    def _lock(self, operation):
+        # Store dipakai bersama oleh beberapa proses (mine.py, run_api.py).
+        # Dibuka read-only agar lock yang sudah ada tetap dapat dipakai di
+        # direktori tanpa izin tulis
+        fd = os.open(self.lock_file, os.O_RDONLY | os.O_CREAT | os.O_CLOEXEC, 0o644)
+        try:
+            fcntl.flock(fd, operation)
+            yield
+        finally:
+            os.close(fd)
+
+    def _source_stat(self):
+        stat = os.stat(self.filename)
+        return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+    def _read_state(self):
+        if not os.path.exists(self.state_file):
+            return None
+
+        with open_chain(self.state_file) as f:
+            return loads(f.read())
+
+    def is_fresh(self):
+        """
+        Memeriksa apakah store sesuai dengan file blockchain JSON.
+
+        Returns:
+            Boolean yang menunjukkan apakah store dapat dipakai
+        """
+        if not os.path.exists(self.filename):
+            return False
+
+        state = self._read_state()
+        return state is not None and state['source'] == self._source_stat()
+
+    def save(self, blockchain):
+        """
+        Menyimpan blockchain ke store.
+
+        Hanya blok yang belum tersimpan yang ditulis; file ditulis ulang
+        seluruhnya jika rantai yang tersimpan tidak lagi menjadi awal dari
+        rantai saat ini. Penulisan ulang dilakukan ke file baru yang kemudian
+        menggantikan file lama, sehingga proses lain yang sedang me-mmap file
+        lama tidak terpengaruh.
+
+        Args:
+            blockchain: Objek blockchain
+        """
+        with self._lock(fcntl.LOCK_EX):
+            try:
+                state = self._read_state()
+            except ValueError:
+                state = None
+            stored = state['length'] if state else 0
+
+            if stored > len(blockchain.chain) or (
+                stored and blockchain.chain[stored - 1].hash != state['last_hash']
+            ):
+                stored = 0
+
+            # File data atau indeks yang hilang atau terpotong tidak dapat ditambah
+            if stored and not (
+                os.path.exists(self.data_file) and os.path.getsize(self.data_file) >= state['data_size']
+                and os.path.exists(self.index_file) and os.path.getsize(self.index_file) >= stored * RECORD.size
+            ):
+                stored = 0
+
+            if stored:
+                data_file, index_file = self.data_file, self.index_file
+            else:
+                data_file, index_file = self.data_file + '.tmp', self.index_file + '.tmp'
+
+            with open(data_file, 'ab' if stored else 'wb') as data, open(index_file, 'ab' if stored else 'wb') as index:
+                # Abaikan sisa tulisan yang tidak tercatat di state
+                data.truncate(state['data_size'] if stored else 0)
+                index.truncate(stored * RECORD.size)
+
+                offset = data.seek(0, os.SEEK_END)
+                index.seek(0, os.SEEK_END)
+                for i in range(stored, len(blockchain.chain)):
+                    block = blockchain.chain[i]
+                    encoded = dumps(block.to_dict())
+                    data.write(encoded)
+                    index.write(RECORD.pack(offset, len(encoded), block.index, block.timestamp))
+                    offset += len(encoded)
+
+                # Data harus tersimpan permanen sebelum state merujuknya
+                for f in (data, index):
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            if not stored:
+                # State lama tidak berlaku untuk file baru; hapus lebih dulu
+                # agar store tidak tampak valid jika proses berhenti di sini
+                if os.path.exists(self.state_file):
+                    os.remove(self.state_file)
+                os.replace(data_file, self.data_file)
+                os.replace(index_file, self.index_file)
+
+            state = {
+                'length': len(blockchain.chain),
+                'last_hash': blockchain.get_latest_block().hash,
+                'data_size': offset,
+                'source': self._source_stat(),
+                'pending_transactions': [tx.to_dict() for tx in blockchain.pending_transactions],
+                'difficulty': blockchain.difficulty,
+                'mining_reward': blockchain.mining_reward,
+                'accounts': blockchain.accounts,
+                'contract_accounts': blockchain.contract_accounts,
+                'transaction_pool': blockchain.transaction_pool
+            }
+
+            tmp_file = self.state_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(dumps(state))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.state_file)
+
+    def load(self):
+        """
+        Memuat blockchain dari store.
+
+        Returns:
+            Objek Blockchain dengan rantai yang didekode secara lazy
+
+        Raises:
+            ValueError: Jika file store tidak lengkap atau tidak sesuai state
+        """
+        with self._lock(fcntl.LOCK_SH):
+            state = self._read_state()
+            if state is None:
+                raise ValueError("State store tidak ditemukan")
+
+            with open(self.data_file, 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            with open(self.index_file, 'rb') as f:
+                index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(data) < state['data_size'] or len(index) < state['length'] * RECORD.size:
+            raise ValueError("File store terpotong")
+
+        # Blok terakhir harus cocok dengan state, mis. bukan data berisi nol
+        # setelah listrik padam
+        chain = LazyChain(data, index, state['length'])
+        if state['length'] and chain[-1].hash != state['last_hash']:
+            raise ValueError("File store tidak sesuai dengan state")
+
+        return blockchain_from_state(state, chain)
+
+def blockchain_from_state(state, chain):
+    """
+    Membuat objek blockchain dari state tersimpan.
+
+    Args:
+        state: Dictionary dengan format Blockchain.to_dict (tanpa 'chain')
+        chain: Daftar blok
+
+    Returns:
+        Objek Blockchain
+    """
+    blockchain = Blockchain(state['difficulty'], state['mining_reward'])
+    blockchain.chain = chain
+    blockchain.pending_transactions = [Transaction.from_dict(tx_dict) for tx_dict in state['pending_transactions']]
+    blockchain.accounts = state['accounts']
+    blockchain.contract_accounts = state['contract_accounts']
+    blockchain.transaction_pool = state['transaction_pool']
+
+    return blockchain
+
+def read_blockchain_file(filename):
+    """
+    Memuat blockchain langsung dari file JSON.
+
+    Setara dengan Blockchain.load_from_file, tetapi file dibaca secara
+    sekuensial dengan buffer besar dan diparse dengan json_utils.loads (orjson).
+
+    Args:
+        filename: Nama file blockchain
+
+    Returns:
+        Objek Blockchain
+    """
+    with open_chain(filename) as f:
+        data = loads(f.read())
+
+    return blockchain_from_state(data, [Block.from_dict(block_dict) for block_dict in data['chain']])
+
+def load_blockchain(filename):
+    """
+    Memuat blockchain, menggunakan store ter-mmap jika masih sesuai.
+
+    Jika store belum ada, sudah usang, atau rusak, file JSON diparse penuh
+    dan store dibangun ulang untuk pemuatan berikutnya. Blok di log yang
+    belum tercakup di file blockchain diterapkan setelahnya.
+
+    Args:
+        filename: Nama file blockchain
+
+    Returns:
+        Objek Blockchain
+    """
+    if not os.path.exists(filename):
+        return Blockchain()
+
+    store = BlockchainStore(filename)
+    try:
+        blockchain = store.load() if store.is_fresh() else None
+    except (OSError, ValueError, KeyError):
+        # Store hanya cache; file JSON tetap menjadi sumber utama
+        blockchain = None
+
+    if blockchain is None:
+        blockchain = read_blockchain_file(filename)
+
+        # Gagal membangun ulang cache (mis. direktori read-only) tidak fatal
+        try:
+            store.save(blockchain)
+        except OSError:
+            pass
+
+    replay_log(blockchain, filename)
+
+    return blockchain
@@ -0,0 +1,192 @@
+import os
+import threading
+from .block import Block
+from ..utils.file_utils import open_chain
+from ..utils.json_utils import dumps, loads
+
+# Ukuran buffer untuk log blok
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Interval default (detik) untuk flush dan fsync log ke disk
+SYNC_INTERVAL = 60
+
+def log_filename(filename):
+    """
+    Mendapatkan nama file log blok untuk file blockchain.
+
+    Args:
+        filename: Nama file blockchain
+
+    Returns:
+        Nama file log
+    """
+    return filename + '.log'
+
+def save_blockchain(blockchain, filename):
+    """
+    Menyimpan blockchain ke file dalam format yang sama dengan save_to_file.
+
+    File ditulis ke file sementara, di-fsync, lalu menggantikan file lama
+    dengan os.replace, sehingga file blockchain tidak pernah terpotong
+    meskipun proses berhenti di tengah penulisan.
+
+    Args:
+        blockchain: Objek blockchain
+        filename: Nama file
+    """
+    tmp_file = filename + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(dumps(blockchain.to_dict(), newline=True))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, filename)
+
+def replay_log(blockchain, filename):
+    """
+    Menerapkan blok dari log yang belum tercakup di file blockchain.
+
+    Args:
+        blockchain: Objek blockchain yang dimuat dari file
+        filename: Nama file blockchain
+
+    Returns:
+        Jumlah blok yang diterapkan
+    """
+    path = log_filename(filename)
+    if not os.path.exists(path):
+        return 0
+
+    replayed = 0
+    with open_chain(path) as f:
+        for line in f:
+            try:
+                block_dict = loads(line)
+            except ValueError:
+                # Baris terakhir bisa terpotong jika proses berhenti mendadak
+                break
+
+            # Blok yang sudah tercakup di file blockchain
+            if block_dict['index'] < len(blockchain.chain):
+                continue
+
+            # Log dari rantai lain (mis. file blockchain diganti) tidak diterapkan
+            if (block_dict['index'] != len(blockchain.chain)
+                    or block_dict['previous_hash'] != blockchain.get_latest_block().hash):
+                break
+
+            block = Block.from_dict(block_dict)
+            blockchain.chain.append(block)
+            blockchain.process_transactions(block.transactions)
+            replayed += 1
+
+    if replayed:
+        # Transaksi tertunda sudah masuk ke blok yang di-mining
+        blockchain.pending_transactions = []
+
+    return replayed
+
+class ChainWriter:
+    """
+    Menyimpan blockchain secara bertahap.
+
+    Setiap blok baru ditambahkan sebagai satu baris JSON ke file log, dan file
+    blockchain lengkap hanya ditulis ulang setiap `save_every` blok, sehingga
+    biaya penyimpanan per blok tidak bertambah seiring panjang rantai.
+
+    Log tidak di-fsync per blok; thread latar belakang melakukan flush dan
+    fsync setiap `sync_interval` detik, serta sekali lagi saat ditutup.
+    """
+    def __init__(self, blockchain, filename, save_every=100, store=None, sync_interval=SYNC_INTERVAL):
+        """
+        Inisialisasi penulis blockchain.
+
+        Args:
+            blockchain: Objek blockchain
+            filename: Nama file blockchain
+            save_every: Jumlah blok di antara dua penulisan file lengkap
+            store: BlockchainStore opsional yang diperbarui setiap checkpoint
+            sync_interval: Interval flush dan fsync log dalam detik (None untuk menonaktifkan)
+        """
+        self.blockchain = blockchain
+        self.filename = filename
+        self.save_every = max(1, save_every)
+        self.store = store
+        self.unsaved = 0
+        self.lock = threading.Lock()
+        self.closed = threading.Event()
+
+        fd = os.open(log_filename(filename), os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644)
+        self.log = open(fd, 'ab', buffering=LOG_BUFFER_SIZE)
+
+        # Log hanya bermakna relatif terhadap file blockchain yang sudah ada
+        if not os.path.exists(filename):
+            self.checkpoint()
+
+        if sync_interval:
+            sync_thread = threading.Thread(target=self.run_sync, args=(sync_interval,))
+            sync_thread.daemon = True
+            sync_thread.start()
+
+    def append(self, block):
+        """
+        Mencatat blok baru.
+
+        Args:
+            block: Blok yang baru di-mining
+        """
+        with self.lock:
+            self.log.write(dumps(block.to_dict(), newline=True))
+            self.unsaved += 1
+
+        if self.unsaved >= self.save_every:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """
+        Menulis file blockchain lengkap dan mengosongkan log.
+        """
+        with self.lock:
+            save_blockchain(self.blockchain, self.filename)
+            if self.store is not None:
+                self.store.save(self.blockchain)
+
+            # Log baru dikosongkan setelah file blockchain tersimpan permanen
+            self.log.truncate(0)
+            self.unsaved = 0
+
+    def sync(self):
+        """
+        Menulis buffer log ke disk dan menunggu hingga tersimpan permanen.
+        """
+        with self.lock:
+            if self.log.closed:
+                return
+
+            self.log.flush()
+            os.fsync(self.log.fileno())
+
+    def run_sync(self, interval):
+        """
+        Menjalankan sync secara berkala sampai writer ditutup.
+
+        Args:
+            interval: Interval sync dalam detik
+        """
+        while not self.closed.wait(interval):
+            self.sync()
+
+    def close(self):
+        """
+        Menyimpan blok yang tersisa dan menutup log.
+        """
+        if self.log.closed:
+            return
+
+        if self.unsaved:
+            self.checkpoint()
+
+        self.sync()
+        self.closed.set()
+
+        with self.lock:
+            self.log.close()
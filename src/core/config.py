@@ -0,0 +1,56 @@
+import os
+import types
+import orjson
+
+# Nilai default untuk setiap bagian config.json
+DEFAULTS = {
+    'node': {
+        'host': '0.0.0.0',
+        'port': 5000,
+        'difficulty': 4,
+        'mining_reward': 50,
+        'peers': []
+    },
+    'api': {
+        'host': '0.0.0.0',
+        'port': 8545
+    },
+    'web': {
+        'host': '0.0.0.0',
+        'port': 8080
+    }
+}
+
+def load_config(path='config.json'):
+    """
+    Membaca file konfigurasi sekali dan meratakannya menjadi namespace.
+
+    Setiap kunci disimpan sebagai atribut `<bagian>_<kunci>` (mis. `node_host`,
+    `api_port`) dan sudah berisi nilai default jika tidak ada di file. Kunci
+    tingkat atas yang bukan bagian (mis. `"version": "1.0"`) diabaikan.
+
+    Args:
+        path: Path file konfigurasi
+
+    Returns:
+        SimpleNamespace berisi konfigurasi
+    """
+    config = {}
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            config = orjson.loads(f.read())
+
+    flat = {}
+    for section in DEFAULTS.keys() | config.keys():
+        values = dict(DEFAULTS.get(section, {}))
+
+        # Hanya objek yang diratakan; nilai skalar tidak menggantikan default
+        overrides = config.get(section)
+        if isinstance(overrides, dict):
+            values.update(overrides)
+
+        for key, value in values.items():
+            # Salin list agar default tidak ikut berubah
+            flat[f"{section}_{key}"] = list(value) if isinstance(value, list) else value
+
+    return types.SimpleNamespace(**flat)
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import signal
+
+# Penanda sementara untuk posisi nonce di dalam header yang diserialisasi
+NONCE_PLACEHOLDER = '__nonce__'
+
+# Jumlah percobaan nonce di antara dua pengecekan sinyal berhenti
+STOP_CHECK_INTERVAL = 4096
+
+# Sinyal berhenti milik proses worker, diisi oleh _init_worker
+_stop_event = None
+
+def split_header(block_header):
+    """
+    Memecah header blok menjadi bagian sebelum dan sesudah nonce.
+
+    Serialisasi identik dengan calculate_hash (json.dumps dengan sort_keys=True),
+    sehingga prefix + str(nonce) + suffix menghasilkan byte yang sama persis
+    dengan yang di-hash oleh Block.validate.
+
+    Args:
+        block_header: Header blok yang akan di-mining
+
+    Returns:
+        Tuple (prefix, suffix) dalam bentuk bytes
+    """
+    header = dict(block_header)
+    header['nonce'] = NONCE_PLACEHOLDER
+    serialized = json.dumps(header, sort_keys=True)
+
+    parts = serialized.split(json.dumps(NONCE_PLACEHOLDER))
+    if len(parts) != 2:
+        raise ValueError("Header blok tidak dapat dipecah pada posisi nonce")
+
+    return parts[0].encode('utf-8'), parts[1].encode('utf-8')
+
+def difficulty_target(difficulty):
+    """
+    Menghitung target hash untuk tingkat kesulitan tertentu.
+
+    Hash hexadecimal yang diawali `difficulty` angka nol setara dengan digest
+    biner yang nilainya lebih kecil dari 16 ** (64 - difficulty), sehingga
+    pengecekan cukup berupa perbandingan bytes.
+
+    Args:
+        difficulty: Tingkat kesulitan (jumlah nol di awal hash)
+
+    Returns:
+        Target dalam bentuk bytes (32 byte, big-endian)
+    """
+    if difficulty <= 0:
+        # Semua digest 32 byte lebih kecil dari 33 byte 0xff
+        return b'\xff' * 33
+
+    return (16 ** (64 - difficulty)).to_bytes(32, 'big')
+
+def compute_midstate(prefix):
+    """
+    Menghitung state SHA-256 setelah memproses prefix header.
+
+    Blok 64 byte yang sudah lengkap di dalam prefix hanya dikompresi sekali;
+    salinan state ini dipakai ulang untuk setiap nonce.
+
+    Args:
+        prefix: Bagian header sebelum nonce
+
+    Returns:
+        Objek hash SHA-256 yang sudah memproses prefix
+    """
+    return hashlib.sha256(prefix)
+
+def find_nonce(prefix, suffix, difficulty, start=0, stride=1, stop_event=None):
+    """
+    Mencari nonce yang memenuhi tingkat kesulitan.
+
+    Header hanya diserialisasi sekali dan prefix-nya di-hash sekali
+    (midstate); setiap iterasi cukup menyalin state, menambahkan nonce dan
+    suffix, lalu membandingkan digest biner dengan target.
+
+    Args:
+        prefix: Bagian header sebelum nonce
+        suffix: Bagian header sesudah nonce
+        difficulty: Tingkat kesulitan (jumlah nol di awal hash)
+        start: Nonce awal
+        stride: Jarak antar nonce yang dicoba
+        stop_event: Event opsional untuk menghentikan pencarian
+
+    Returns:
+        Tuple (nonce, hash) yang memenuhi tingkat kesulitan, atau None jika
+        pencarian dihentikan melalui stop_event
+    """
+    target = difficulty_target(difficulty)
+    midstate = compute_midstate(prefix)
+    batch_start = start
+    batch_size = stride * STOP_CHECK_INTERVAL
+
+    while stop_event is None or not stop_event.is_set():
+        for nonce in range(batch_start, batch_start + batch_size, stride):
+            h = midstate.copy()
+            h.update(str(nonce).encode() + suffix)
+            digest = h.digest()
+
+            if digest < target:
+                return nonce, digest.hex()
+
+        batch_start += batch_size
+
+    return None
+
+def proof_of_work(block_header, difficulty):
+    """
+    Implementasi Proof of Work yang kompatibel dengan crypto_utils.proof_of_work.
+
+    Args:
+        block_header: Header blok yang akan di-mining
+        difficulty: Tingkat kesulitan (jumlah nol di awal hash)
+
+    Returns:
+        Tuple (nonce, hash) yang memenuhi tingkat kesulitan
+    """
+    prefix, suffix = split_header(block_header)
+    nonce, block_hash = find_nonce(prefix, suffix, difficulty)
+    block_header['nonce'] = nonce
+
+    return nonce, block_hash
+
+def _init_worker(stop_event):
+    """
+    Inisialisasi proses worker untuk ParallelMiner.
+
+    Args:
+        stop_event: Event bersama untuk menghentikan pencarian
+    """
+    global _stop_event
+    _stop_event = stop_event
+
+    # Ctrl+C dan SIGTERM ke seluruh process group ditangani oleh proses
+    # utama, yang menghentikan worker melalui close()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+def _search(task):
+    """
+    Mencari nonce pada satu partisi ruang nonce di dalam proses worker.
+
+    Args:
+        task: Tuple (prefix, suffix, difficulty, start, stride)
+
+    Returns:
+        Tuple (nonce, hash), atau None jika worker lain sudah menemukan nonce
+    """
+    prefix, suffix, difficulty, start, stride = task
+    result = find_nonce(prefix, suffix, difficulty, start, stride, _stop_event)
+
+    if result is not None:
+        _stop_event.set()
+
+    return result
+
+class ParallelMiner:
+    """
+    Proof of Work paralel yang membagi ruang nonce ke beberapa proses.
+
+    Worker ke-i mencoba nonce i, i + N, i + 2N, ... sehingga tidak ada nonce
+    yang dicoba dua kali. Worker pertama yang menemukan nonce valid
+    menghentikan worker lainnya melalui Event bersama.
+    """
+    def __init__(self, workers=None):
+        """
+        Inisialisasi pool worker.
+
+        Args:
+            workers: Jumlah proses worker (default: jumlah CPU)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.stop_event = multiprocessing.Event()
+        self.pool = multiprocessing.Pool(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(self.stop_event,)
+        )
+
+    def proof_of_work(self, block_header, difficulty):
+        """
+        Implementasi Proof of Work yang kompatibel dengan crypto_utils.proof_of_work.
+
+        Args:
+            block_header: Header blok yang akan di-mining
+            difficulty: Tingkat kesulitan (jumlah nol di awal hash)
+
+        Returns:
+            Tuple (nonce, hash) yang memenuhi tingkat kesulitan
+        """
+        prefix, suffix = split_header(block_header)
+        tasks = [
+            (prefix, suffix, difficulty, worker_id, self.workers)
+            for worker_id in range(self.workers)
+        ]
+
+        # Tunggu semua worker selesai agar tidak ada yang masih berjalan
+        # ketika sinyal berhenti di-reset untuk blok berikutnya
+        self.stop_event.clear()
+        results = [r for r in self.pool.imap_unordered(_search, tasks) if r is not None]
+
+        nonce, block_hash = min(results)
+        block_header['nonce'] = nonce
+
+        return nonce, block_hash
+
+    def close(self):
+        """
+        Menghentikan semua proses worker.
+
+        Pencarian yang sedang berjalan dihentikan melalui stop_event lalu
+        worker keluar dengan sendirinya; pool.terminate() tidak dipakai
+        karena mengirim SIGTERM yang diabaikan worker.
+        """
+        self.stop_event.set()
+        self.pool.close()
+        self.pool.join()
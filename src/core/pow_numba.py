@@ -0,0 +1,225 @@
+import hashlib
+import numpy as np
+from numba import njit, prange, get_num_threads
+from .fast_pow import split_header
+
+# Konstanta ronde SHA-256 (FIPS 180-4)
+K = np.array([
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+], dtype=np.int64)
+
+# Nilai hash awal SHA-256
+H0 = np.array([
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+], dtype=np.int64)
+
+MASK = 0xFFFFFFFF
+
+# Jumlah nonce yang dicoba setiap lane sebelum hasil batch diperiksa
+LANE_BATCH = 4096
+
+# Word 32-bit disimpan di int64 agar aritmetika tidak tercampur signed/unsigned
+
+@njit(cache=True, nogil=True)
+def _rotr(x, n):
+    return ((x >> n) | (x << (32 - n))) & MASK
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def _compress(state, data, offset, w):
+    for i in range(16):
+        j = offset + 4 * i
+        w[i] = (np.int64(data[j]) << 24) | (np.int64(data[j + 1]) << 16) | (np.int64(data[j + 2]) << 8) | np.int64(data[j + 3])
+
+    for i in range(16, 64):
+        s0 = _rotr(w[i - 15], 7) ^ _rotr(w[i - 15], 18) ^ (w[i - 15] >> 3)
+        s1 = _rotr(w[i - 2], 17) ^ _rotr(w[i - 2], 19) ^ (w[i - 2] >> 10)
+        w[i] = (w[i - 16] + s0 + w[i - 7] + s1) & MASK
+
+    a, b, c, d, e, f, g, h = state[0], state[1], state[2], state[3], state[4], state[5], state[6], state[7]
+
+    for i in range(64):
+        s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+        ch = (e & f) ^ ((e ^ MASK) & g)
+        t1 = (h + s1 + ch + K[i] + w[i]) & MASK
+        s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+        maj = (a & b) ^ (a & c) ^ (b & c)
+        t2 = (s0 + maj) & MASK
+
+        h = g
+        g = f
+        f = e
+        e = (d + t1) & MASK
+        d = c
+        c = b
+        b = a
+        a = (t1 + t2) & MASK
+
+    state[0] = (state[0] + a) & MASK
+    state[1] = (state[1] + b) & MASK
+    state[2] = (state[2] + c) & MASK
+    state[3] = (state[3] + d) & MASK
+    state[4] = (state[4] + e) & MASK
+    state[5] = (state[5] + f) & MASK
+    state[6] = (state[6] + g) & MASK
+    state[7] = (state[7] + h) & MASK
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def _midstate(prefix, consumed):
+    state = H0.copy()
+    w = np.empty(64, dtype=np.int64)
+
+    for offset in range(0, consumed, 64):
+        _compress(state, prefix, offset, w)
+
+    return state
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def _check_nonce(nonce, midstate, tail, suffix, consumed, difficulty, buf, state, w):
+    # Sisa prefix yang belum dikompresi
+    n = tail.shape[0]
+    for i in range(n):
+        buf[i] = tail[i]
+
+    # Nonce dalam bentuk desimal, sama seperti json.dumps
+    digits = 1
+    x = nonce
+    while x >= 10:
+        x //= 10
+        digits += 1
+
+    x = nonce
+    for i in range(digits):
+        buf[n + digits - 1 - i] = 48 + x % 10
+        x //= 10
+    n += digits
+
+    for i in range(suffix.shape[0]):
+        buf[n + i] = suffix[i]
+    n += suffix.shape[0]
+
+    # Padding SHA-256
+    padded = (n + 9 + 63) // 64 * 64
+    buf[n] = 0x80
+    for i in range(n + 1, padded - 8):
+        buf[i] = 0
+
+    bit_length = (consumed + n) * 8
+    for i in range(8):
+        buf[padded - 1 - i] = (bit_length >> (8 * i)) & 0xFF
+
+    for i in range(8):
+        state[i] = midstate[i]
+    for offset in range(0, padded, 64):
+        _compress(state, buf, offset, w)
+
+    # Cek jumlah nol hexadecimal di awal hash
+    for i in range(difficulty // 8):
+        if state[i] != 0:
+            return False
+
+    remainder = difficulty % 8
+    if remainder:
+        return (state[difficulty // 8] >> (32 - 4 * remainder)) == 0
+
+    return True
+
+@njit(cache=True, parallel=True, nogil=True, boundscheck=False)
+def _search(midstate, tail, suffix, consumed, difficulty, start, stride, lanes):
+    buf_size = (tail.shape[0] + 20 + suffix.shape[0] + 9 + 63) // 64 * 64
+
+    while True:
+        found = np.full(lanes, -1, dtype=np.int64)
+
+        for lane in prange(lanes):
+            buf = np.zeros(buf_size, dtype=np.uint8)
+            state = np.empty(8, dtype=np.int64)
+            w = np.empty(64, dtype=np.int64)
+
+            for k in range(LANE_BATCH):
+                nonce = start + (k * lanes + lane) * stride
+                if _check_nonce(nonce, midstate, tail, suffix, consumed, difficulty, buf, state, w):
+                    found[lane] = nonce
+                    break
+
+        # Nonce pertama tiap lane adalah yang terkecil di lane tersebut
+        best = -1
+        for lane in range(lanes):
+            if found[lane] >= 0 and (best < 0 or found[lane] < best):
+                best = found[lane]
+
+        if best >= 0:
+            return best
+
+        start += LANE_BATCH * lanes * stride
+
+def find_nonce(prefix, suffix, difficulty, start=0, stride=1):
+    """
+    Mencari nonce yang memenuhi tingkat kesulitan menggunakan kernel Numba.
+
+    SHA-256 diimplementasikan langsung di atas array integer sehingga seluruh
+    loop nonce berjalan sebagai kode native dan dibagi ke beberapa thread
+    melalui prange.
+
+    Args:
+        prefix: Bagian header sebelum nonce
+        suffix: Bagian header sesudah nonce
+        difficulty: Tingkat kesulitan (jumlah nol di awal hash)
+        start: Nonce awal
+        stride: Jarak antar nonce yang dicoba
+
+    Returns:
+        Tuple (nonce, hash) yang memenuhi tingkat kesulitan
+    """
+    consumed = len(prefix) - len(prefix) % 64
+    prefix_array = np.frombuffer(prefix, dtype=np.uint8)
+    suffix_array = np.frombuffer(suffix, dtype=np.uint8)
+
+    nonce = int(_search(
+        _midstate(prefix_array, consumed),
+        prefix_array[consumed:],
+        suffix_array,
+        consumed,
+        difficulty,
+        start,
+        stride,
+        get_num_threads()
+    ))
+
+    return nonce, hashlib.sha256(prefix + str(nonce).encode() + suffix).hexdigest()
+
+def proof_of_work(block_header, difficulty):
+    """
+    Implementasi Proof of Work yang kompatibel dengan crypto_utils.proof_of_work.
+
+    Args:
+        block_header: Header blok yang akan di-mining
+        difficulty: Tingkat kesulitan (jumlah nol di awal hash)
+
+    Returns:
+        Tuple (nonce, hash) yang memenuhi tingkat kesulitan
+    """
+    prefix, suffix = split_header(block_header)
+    nonce, block_hash = find_nonce(prefix, suffix, difficulty)
+    block_header['nonce'] = nonce
+
+    return nonce, block_hash
+
+def warm_up():
+    """
+    Mengkompilasi semua kernel dan menyimpannya ke cache Numba di disk.
+
+    Tanpa pemanggilan ini, kernel dikompilasi dan di-cache pada mining
+    pertama dengan --numba. Jalankan `python -m src.core.pow_numba` setelah
+    instalasi agar mining pertama tidak menunggu kompilasi JIT.
+    """
+    proof_of_work({'index': 0, 'previous_hash': '0', 'nonce': 0}, 1)
+
+if __name__ == '__main__':
+    warm_up()
@@ -0,0 +1,352 @@
+import functools
+import os
+import secrets
+import stat
+import threading
+from multiprocessing.managers import BaseManager, BaseProxy
+from ..core.blockchain import Blockchain
+
+# Variabel lingkungan opsional untuk kunci autentikasi RPC yang ditentukan sendiri
+AUTHKEY_ENV = 'GHALBIR_RPC_AUTHKEY'
+
+# Method Blockchain yang dipanggil di proses pemilik state, bukan di salinan
+METHODS = frozenset(
+    name for name in dir(Blockchain)
+    if not name.startswith('_') and callable(getattr(Blockchain, name))
+)
+
+# Atribut container yang diakses di tempat melalui proxy, bukan sebagai salinan
+SHARED_ATTRIBUTES = frozenset(['chain', 'accounts', 'contract_accounts', 'transaction_pool'])
+
+def synchronized(lock, func):
+    """
+    Membungkus fungsi agar dijalankan sambil memegang lock.
+
+    Args:
+        lock: Lock yang dipakai bersama
+        func: Fungsi yang dibungkus
+
+    Returns:
+        Fungsi yang sudah dibungkus
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with lock:
+            return func(*args, **kwargs)
+
+    return wrapper
+
+class SharedAttribute:
+    """
+    Container milik blockchain aktif (chain, accounts, dst.) di proses node.
+
+    Setiap operasi mengambil container dari blockchain aktif saat itu juga,
+    sehingga tetap benar setelah node mengganti blockchain-nya.
+    """
+    def __init__(self, handle, name):
+        """
+        Inisialisasi atribut bersama.
+
+        Args:
+            handle: BlockchainHandle pemilik
+            name: Nama atribut blockchain
+        """
+        self._handle = handle
+        self._name = name
+
+    def _target(self):
+        return getattr(self._handle._get_blockchain(), self._name)
+
+    def __len__(self):
+        with self._handle._lock:
+            return len(self._target())
+
+    def __getitem__(self, key):
+        with self._handle._lock:
+            return self._target()[key]
+
+    def __setitem__(self, key, value):
+        with self._handle._lock:
+            self._target()[key] = value
+
+    def __delitem__(self, key):
+        with self._handle._lock:
+            del self._target()[key]
+
+    def __contains__(self, key):
+        with self._handle._lock:
+            return key in self._target()
+
+    def get(self, key, default=None):
+        with self._handle._lock:
+            return self._target().get(key, default)
+
+    def keys(self):
+        with self._handle._lock:
+            return list(self._target().keys())
+
+    def values(self):
+        with self._handle._lock:
+            return list(self._target().values())
+
+    def items(self):
+        with self._handle._lock:
+            return list(self._target().items())
+
+    def snapshot(self):
+        with self._handle._lock:
+            return list(self._target())
+
+class SharedAttributeProxy(BaseProxy):
+    """
+    Proxy untuk SharedAttribute yang berperilaku seperti list atau dict.
+
+    Penugasan elemen (mis. `accounts[alamat] = saldo`) langsung mengubah
+    state di proses node, dan pembacaan satu elemen hanya menyalin elemen
+    tersebut.
+    """
+    _exposed_ = ('__len__', '__getitem__', '__setitem__', '__delitem__', '__contains__',
+                 'get', 'keys', 'values', 'items', 'snapshot')
+
+    def __len__(self):
+        return self._callmethod('__len__')
+
+    def __getitem__(self, key):
+        return self._callmethod('__getitem__', (key,))
+
+    def __setitem__(self, key, value):
+        self._callmethod('__setitem__', (key, value))
+
+    def __delitem__(self, key):
+        self._callmethod('__delitem__', (key,))
+
+    def __contains__(self, key):
+        return self._callmethod('__contains__', (key,))
+
+    def __iter__(self):
+        # Satu kali salin lebih murah dibanding satu panggilan per elemen
+        return iter(self._callmethod('snapshot'))
+
+    def get(self, key, default=None):
+        return self._callmethod('get', (key, default))
+
+    def keys(self):
+        return self._callmethod('keys')
+
+    def values(self):
+        return self._callmethod('values')
+
+    def items(self):
+        return self._callmethod('items')
+
+class BlockchainHandle:
+    """
+    Objek di proses node yang meneruskan akses ke blockchain aktif.
+
+    Node dapat mengganti blockchain-nya saat sinkronisasi dengan peer,
+    sehingga handle selalu mengambil blockchain terbaru melalui callable.
+    Semua akses dilakukan sambil memegang lock, karena thread server RPC
+    berjalan bersamaan dengan thread milik node.
+    """
+    def __init__(self, get_blockchain, lock=None):
+        """
+        Inisialisasi handle.
+
+        Args:
+            get_blockchain: Callable yang mengembalikan blockchain aktif
+            lock: Lock yang juga dipegang node saat mengakses blockchain
+        """
+        self._get_blockchain = get_blockchain
+        self._lock = lock or threading.RLock()
+
+    def _check(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+    def get(self, name):
+        self._check(name)
+        with self._lock:
+            return getattr(self._get_blockchain(), name)
+
+    def set(self, name, value):
+        self._check(name)
+        with self._lock:
+            setattr(self._get_blockchain(), name, value)
+
+    def call(self, name, args, kwargs):
+        self._check(name)
+        with self._lock:
+            return getattr(self._get_blockchain(), name)(*args, **kwargs)
+
+    def attribute(self, name):
+        if name not in SHARED_ATTRIBUTES:
+            raise AttributeError(name)
+        return SharedAttribute(self, name)
+
+class BlockchainProxy(BaseProxy):
+    """
+    Proxy yang dapat dipakai di tempat objek Blockchain.
+
+    Pemanggilan method dieksekusi di proses node. Atribut container
+    (SHARED_ATTRIBUTES) dikembalikan sebagai proxy sehingga dapat diubah di
+    tempat seperti oleh VirtualMachine; atribut lain dikembalikan sebagai
+    salinan nilainya.
+
+    Setiap panggilan dikunci sendiri-sendiri. Urutan baca-ubah-tulis yang
+    terdiri dari beberapa panggilan (mis. get_balance lalu
+    `accounts[alamat] = ...` di VirtualMachine) tidak atomik: thread node
+    dapat mengubah state di antaranya sehingga salah satu perubahan hilang.
+    Perubahan yang harus atomik perlu dilakukan melalui satu method
+    Blockchain, yang dijalankan utuh di bawah lock.
+    """
+    _exposed_ = ('get', 'set', 'call', 'attribute')
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        if name in METHODS:
+            return functools.partial(self._call, name)
+
+        if name in SHARED_ATTRIBUTES:
+            # Proxy dipakai ulang agar tidak membuat koneksi baru setiap akses
+            try:
+                attributes = object.__getattribute__(self, '_attributes')
+            except AttributeError:
+                attributes = {}
+                object.__setattr__(self, '_attributes', attributes)
+
+            if name not in attributes:
+                attributes[name] = self._callmethod('attribute', (name,))
+            return attributes[name]
+
+        return self._callmethod('get', (name,))
+
+    def __setattr__(self, name, value):
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+        else:
+            self._callmethod('set', (name, value))
+
+    def _call(self, name, *args, **kwargs):
+        return self._callmethod('call', (name, args, kwargs))
+
+class BlockchainManager(BaseManager):
+    """
+    Manager untuk berbagi satu blockchain antar proses melalui UNIX socket.
+    """
+    pass
+
+def _register_proxies(get_blockchain=None):
+    # Tipe SharedAttribute hanya dibuat sebagai hasil BlockchainHandle.attribute
+    BlockchainManager.register(
+        'get_blockchain',
+        callable=get_blockchain,
+        proxytype=BlockchainProxy,
+        method_to_typeid={'attribute': 'SharedAttribute'}
+    )
+    BlockchainManager.register('SharedAttribute', proxytype=SharedAttributeProxy, create_method=False)
+
+def key_filename(address):
+    """
+    Mendapatkan nama file kunci autentikasi untuk socket.
+
+    Args:
+        address: Path UNIX socket
+
+    Returns:
+        Nama file kunci
+    """
+    return address + '.key'
+
+def _create_authkey(address):
+    if os.environ.get(AUTHKEY_ENV):
+        return os.environ[AUTHKEY_ENV].encode('utf-8')
+
+    # Kunci acak baru setiap kali node dijalankan, hanya dapat dibaca pemiliknya
+    path = key_filename(address)
+    if os.path.lexists(path):
+        if not stat.S_ISREG(os.lstat(path).st_mode):
+            raise FileExistsError(f"{path} sudah ada dan bukan file kunci")
+        os.remove(path)
+
+    authkey = secrets.token_bytes(32)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_CLOEXEC, 0o600)
+    with open(fd, 'wb') as f:
+        f.write(authkey)
+
+    return authkey
+
+def _read_authkey(address):
+    if os.environ.get(AUTHKEY_ENV):
+        return os.environ[AUTHKEY_ENV].encode('utf-8')
+
+    with open(key_filename(address), 'rb') as f:
+        return f.read()
+
+def serve_blockchain(get_blockchain, address, lock=None):
+    """
+    Membagikan blockchain milik proses ini melalui UNIX socket.
+
+    Manager berkomunikasi dengan pickle, sehingga siapa pun yang dapat
+    terhubung dapat menjalankan kode di proses ini. Koneksi diautentikasi
+    dengan kunci acak di file `<address>.key` (mode 0600), atau dengan
+    GHALBIR_RPC_AUTHKEY jika di-set, dan socket dibuat dengan mode 0600.
+
+    Args:
+        get_blockchain: Callable yang mengembalikan blockchain aktif
+        address: Path UNIX socket
+        lock: Lock yang juga dipegang node saat mengakses blockchain
+
+    Returns:
+        Objek server manager
+
+    Raises:
+        FileExistsError: Jika address sudah ada dan bukan socket, atau file
+            kunci sudah ada dan bukan file biasa
+    """
+    handle = BlockchainHandle(get_blockchain, lock)
+    _register_proxies(lambda: handle)
+
+    # Hapus socket sisa proses sebelumnya, tetapi jangan file lain
+    if os.path.lexists(address):
+        if not stat.S_ISSOCK(os.lstat(address).st_mode):
+            raise FileExistsError(f"{address} sudah ada dan bukan UNIX socket")
+        os.remove(address)
+
+    authkey = _create_authkey(address)
+
+    # Socket langsung dibuat dengan mode 0600; chmod setelah bind masih
+    # menyisakan jeda ketika proses lain dapat terhubung
+    old_umask = os.umask(0o177)
+    try:
+        server = BlockchainManager(address=address, authkey=authkey).get_server()
+    finally:
+        os.umask(old_umask)
+    os.chmod(address, 0o600)
+
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+
+    return server
+
+def connect_blockchain(address):
+    """
+    Terhubung ke blockchain yang dibagikan oleh proses lain.
+
+    Kunci autentikasi dibaca dari file `<address>.key` yang ditulis
+    serve_blockchain, atau dari GHALBIR_RPC_AUTHKEY jika di-set.
+
+    Args:
+        address: Path UNIX socket
+
+    Returns:
+        BlockchainProxy
+    """
+    _register_proxies()
+
+    manager = BlockchainManager(address=address, authkey=_read_authkey(address))
+    manager.connect()
+
+    return manager.get_blockchain()
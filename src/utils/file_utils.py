@@ -0,0 +1,24 @@
+import io
+import os
+
+# Ukuran buffer untuk membaca file blockchain
+READ_BUFFER_SIZE = 16 * 1024
+
+def open_chain(path):
+    """
+    Membuka file blockchain untuk dibaca berurutan dari awal sampai akhir.
+
+    Kernel diberi tahu pola akses sekuensial (jika didukung platform) agar
+    read-ahead diperbesar, dan file dibuka dengan buffer 16 KiB.
+
+    Args:
+        path: Path file
+
+    Returns:
+        File object biner yang ter-buffer
+    """
+    fd = os.open(path, os.O_RDONLY)
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+    return io.open(fd, 'rb', buffering=READ_BUFFER_SIZE)
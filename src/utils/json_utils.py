@@ -0,0 +1,46 @@
+import json
+import re
+import orjson
+
+# Angka JSON dengan 20 digit atau lebih, yang dapat melebihi rentang 64-bit
+# orjson (mis. saldo dalam satuan wei)
+_LARGE_INT = re.compile(rb'[:\[,]\s*-?\d{20,}')
+
+def dumps(obj, newline=False):
+    """
+    Menserialisasi objek ke JSON dengan orjson.
+
+    orjson hanya mendukung integer 64-bit; untuk integer yang lebih besar
+    serialisasi jatuh kembali ke modul json standar, yang hasilnya tetap
+    dapat dibaca oleh Blockchain.load_from_file.
+
+    Args:
+        obj: Objek yang diserialisasi
+        newline: Tambahkan newline di akhir (untuk file NDJSON)
+
+    Returns:
+        JSON dalam bentuk bytes
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE if newline else None)
+    except orjson.JSONEncodeError:
+        data = json.dumps(obj, separators=(',', ':')).encode('utf-8')
+        return data + b'\n' if newline else data
+
+def loads(data):
+    """
+    Memparse JSON dengan orjson tanpa kehilangan presisi integer besar.
+
+    orjson mengubah integer di luar rentang 64-bit menjadi float secara diam-
+    diam, sehingga data yang mungkin berisi integer seperti itu diparse
+    dengan modul json standar.
+
+    Args:
+        data: JSON dalam bentuk bytes
+
+    Returns:
+        Objek hasil parse
+    """
+    if _LARGE_INT.search(data):
+        return json.loads(bytes(data))
+    return orjson.loads(data)
@@ -0,0 +1,132 @@
+import unittest
+import os
+import shutil
+import tempfile
+import importlib.util
+from tests.test_chain_writer import add_block
+
+HAS_CORE = importlib.util.find_spec('src.core.block') is not None
+
+@unittest.skipUnless(HAS_CORE, "src.core.block tidak tersedia")
+class TestBlockchainStore(unittest.TestCase):
+    def setUp(self):
+        from src.core.blockchain import Blockchain
+        from src.core.chain_writer import save_blockchain
+
+        # Direktori sementara untuk file blockchain
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'blockchain.json')
+
+        self.blockchain = Blockchain(difficulty=1)
+        for _ in range(3):
+            add_block(self.blockchain)
+        self.blockchain.accounts['0xa'] = 10
+        save_blockchain(self.blockchain, self.filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_save_load(self):
+        """Pengujian store yang disimpan dimuat kembali dengan isi yang sama"""
+        from src.core.blockchain_store import BlockchainStore
+
+        store = BlockchainStore(self.filename)
+        store.save(self.blockchain)
+        self.assertTrue(store.is_fresh())
+
+        loaded = store.load()
+        self.assertEqual(len(loaded.chain), 4)
+        self.assertEqual(loaded.chain[-1].hash, self.blockchain.chain[-1].hash)
+        self.assertEqual([b.index for b in loaded.chain[1:3]], [1, 2])
+        self.assertEqual(loaded.accounts, {'0xa': 10})
+
+    def test_large_balances(self):
+        """Pengujian saldo di luar rentang 64-bit (wei) tersimpan utuh"""
+        from src.core.blockchain import Blockchain
+        from src.core.blockchain_store import BlockchainStore, read_blockchain_file
+        from src.core.chain_writer import save_blockchain
+
+        self.blockchain.accounts['0xa'] = 10 ** 30
+        save_blockchain(self.blockchain, self.filename)
+
+        self.assertEqual(Blockchain.load_from_file(self.filename).accounts['0xa'], 10 ** 30)
+        self.assertEqual(read_blockchain_file(self.filename).accounts['0xa'], 10 ** 30)
+
+        store = BlockchainStore(self.filename)
+        store.save(self.blockchain)
+        self.assertEqual(store.load().accounts['0xa'], 10 ** 30)
+
+    def test_append_only_save(self):
+        """Pengujian blok baru ditambahkan tanpa menulis ulang blok lama"""
+        from src.core.blockchain_store import BlockchainStore
+
+        store = BlockchainStore(self.filename)
+        store.save(self.blockchain)
+        size = os.path.getsize(store.data_file)
+
+        add_block(self.blockchain)
+        store.save(self.blockchain)
+
+        self.assertGreater(os.path.getsize(store.data_file), size)
+        self.assertEqual(store.load().chain[4].hash, self.blockchain.chain[4].hash)
+
+    def test_stale_store(self):
+        """Pengujian store usang setelah file blockchain berubah"""
+        from src.core.blockchain_store import BlockchainStore
+        from src.core.chain_writer import save_blockchain
+
+        store = BlockchainStore(self.filename)
+        store.save(self.blockchain)
+
+        add_block(self.blockchain)
+        save_blockchain(self.blockchain, self.filename)
+        self.assertFalse(store.is_fresh())
+
+    def test_load_blockchain_falls_back(self):
+        """Pengujian load_blockchain memakai file JSON jika store rusak"""
+        from src.core.blockchain_store import BlockchainStore, load_blockchain
+
+        self.assertEqual(len(load_blockchain(self.filename).chain), 4)
+
+        store = BlockchainStore(self.filename)
+        self.assertTrue(store.is_fresh())
+        os.remove(store.data_file)
+
+        self.assertEqual(len(load_blockchain(self.filename).chain), 4)
+        self.assertEqual(len(store.load().chain), 4)
+
+    def test_load_rejects_zeroed_data(self):
+        """Pengujian data berisi nol (mis. setelah listrik padam) tidak dipakai"""
+        from src.core.blockchain_store import BlockchainStore, load_blockchain
+
+        store = BlockchainStore(self.filename)
+        store.save(self.blockchain)
+
+        size = os.path.getsize(store.data_file)
+        with open(store.data_file, 'r+b') as f:
+            f.write(b'\0' * size)
+
+        with self.assertRaises(ValueError):
+            store.load()
+        self.assertEqual(load_blockchain(self.filename).chain[-1].hash, self.blockchain.chain[-1].hash)
+
+    @unittest.skipIf(os.geteuid() == 0, "root mengabaikan izin direktori")
+    def test_load_read_only_directory(self):
+        """Pengujian blockchain tetap dimuat dari direktori read-only"""
+        from src.core.blockchain_store import load_blockchain
+
+        os.chmod(self.tmpdir, 0o555)
+        try:
+            self.assertEqual(len(load_blockchain(self.filename).chain), 4)
+        finally:
+            os.chmod(self.tmpdir, 0o755)
+
+    def test_load_missing_file(self):
+        """Pengujian blockchain baru dibuat jika file tidak ada"""
+        from src.core.blockchain_store import load_blockchain
+
+        blockchain = load_blockchain(os.path.join(self.tmpdir, 'missing.json'))
+        self.assertEqual(len(blockchain.chain), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+import os
+import time
+import shutil
+import tempfile
+import importlib.util
+
+HAS_CORE = importlib.util.find_spec('src.core.block') is not None
+
+def add_block(blockchain):
+    """Menambahkan blok kosong yang sudah di-mining ke blockchain"""
+    from src.core.block import Block
+
+    block = Block(len(blockchain.chain), blockchain.get_latest_block().hash, int(time.time()), [], 1)
+    block.mine_block()
+    blockchain.chain.append(block)
+    return block
+
+@unittest.skipUnless(HAS_CORE, "src.core.block tidak tersedia")
+class TestChainWriter(unittest.TestCase):
+    def setUp(self):
+        from src.core.blockchain import Blockchain
+
+        # Direktori sementara untuk file blockchain
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'blockchain.json')
+        self.blockchain = Blockchain(difficulty=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def load(self):
+        from src.core.blockchain import Blockchain
+        from src.core.chain_writer import replay_log
+
+        blockchain = Blockchain.load_from_file(self.filename)
+        replay_log(blockchain, self.filename)
+        return blockchain
+
+    def test_save_blockchain_format(self):
+        """Pengujian file yang ditulis dapat dimuat oleh Blockchain.load_from_file"""
+        from src.core.blockchain import Blockchain
+        from src.core.chain_writer import save_blockchain
+
+        add_block(self.blockchain)
+        self.blockchain.accounts['0xa'] = 10
+        save_blockchain(self.blockchain, self.filename)
+
+        loaded = Blockchain.load_from_file(self.filename)
+        self.assertEqual(loaded.to_dict(), self.blockchain.to_dict())
+        self.assertFalse(os.path.exists(self.filename + '.tmp'))
+
+    def test_log_round_trip(self):
+        """Pengujian blok di log diterapkan kembali saat dimuat"""
+        from src.core.chain_writer import ChainWriter, log_filename
+
+        writer = ChainWriter(self.blockchain, self.filename, save_every=100, sync_interval=None)
+        try:
+            for _ in range(3):
+                writer.append(add_block(self.blockchain))
+
+            # Blok baru hanya ada di log sampai checkpoint berikutnya
+            writer.sync()
+            self.assertGreater(os.path.getsize(log_filename(self.filename)), 0)
+
+            loaded = self.load()
+            self.assertEqual([b.hash for b in loaded.chain], [b.hash for b in self.blockchain.chain])
+        finally:
+            writer.close()
+
+    def test_checkpoint_truncates_log(self):
+        """Pengujian checkpoint menulis file lengkap dan mengosongkan log"""
+        from src.core.chain_writer import ChainWriter, log_filename
+
+        writer = ChainWriter(self.blockchain, self.filename, save_every=2, sync_interval=None)
+        for _ in range(2):
+            writer.append(add_block(self.blockchain))
+        self.assertEqual(os.path.getsize(log_filename(self.filename)), 0)
+
+        writer.append(add_block(self.blockchain))
+        writer.close()
+        writer.close()
+
+        # close() menyimpan blok yang tersisa
+        self.assertEqual(os.path.getsize(log_filename(self.filename)), 0)
+        self.assertEqual(len(self.load().chain), 4)
+
+    def test_replay_ignores_truncated_line(self):
+        """Pengujian baris terakhir yang terpotong diabaikan"""
+        from src.core.chain_writer import ChainWriter, log_filename
+
+        writer = ChainWriter(self.blockchain, self.filename, sync_interval=None)
+        writer.append(add_block(self.blockchain))
+        writer.sync()
+
+        with open(log_filename(self.filename), 'ab') as f:
+            f.write(b'{"index": 2, "previous')
+
+        self.assertEqual(len(self.load().chain), 2)
+        writer.close()
+
+    def test_replay_ignores_foreign_log(self):
+        """Pengujian log dari blockchain lain tidak disambung ke rantai"""
+        from src.core.blockchain import Blockchain
+        from src.core.chain_writer import ChainWriter, save_blockchain
+
+        # Log sisa dari blockchain yang kemudian diganti
+        writer = ChainWriter(self.blockchain, self.filename, sync_interval=None)
+        writer.append(add_block(self.blockchain))
+        writer.sync()
+
+        other = Blockchain(difficulty=2)
+        save_blockchain(other, self.filename)
+
+        loaded = self.load()
+        self.assertEqual([b.hash for b in loaded.chain], [b.hash for b in other.chain])
+        writer.log.close()
+
+if __name__ == '__main__':
+    unittest.main()
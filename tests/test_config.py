@@ -0,0 +1,59 @@
+import unittest
+import os
+import json
+import shutil
+import tempfile
+from src.core.config import load_config
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        # Direktori sementara untuk file konfigurasi
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'config.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def write_config(self, config):
+        with open(self.path, 'w') as f:
+            json.dump(config, f)
+
+    def test_defaults(self):
+        """Pengujian nilai default jika file konfigurasi tidak ada"""
+        cfg = load_config(self.path)
+
+        self.assertEqual(cfg.node_host, '0.0.0.0')
+        self.assertEqual(cfg.node_port, 5000)
+        self.assertEqual(cfg.node_difficulty, 4)
+        self.assertEqual(cfg.node_mining_reward, 50)
+        self.assertEqual(cfg.node_peers, [])
+        self.assertEqual(cfg.api_port, 8545)
+        self.assertEqual(cfg.web_port, 8080)
+
+    def test_overrides(self):
+        """Pengujian nilai dari file menggantikan default per kunci"""
+        self.write_config({'node': {'port': 6000, 'peers': ['127.0.0.1:5001']}, 'api': {'host': '127.0.0.1'}})
+        cfg = load_config(self.path)
+
+        self.assertEqual(cfg.node_port, 6000)
+        self.assertEqual(cfg.node_host, '0.0.0.0')
+        self.assertEqual(cfg.node_peers, ['127.0.0.1:5001'])
+        self.assertEqual(cfg.api_host, '127.0.0.1')
+        self.assertEqual(cfg.api_port, 8545)
+
+    def test_top_level_scalars(self):
+        """Pengujian kunci tingkat atas yang bukan bagian diabaikan"""
+        self.write_config({'version': '1.0', 'node': {'port': 6000}})
+        cfg = load_config(self.path)
+
+        self.assertEqual(cfg.node_port, 6000)
+        self.assertEqual(cfg.api_port, 8545)
+        self.assertFalse(hasattr(cfg, 'version'))
+
+    def test_defaults_not_shared(self):
+        """Pengujian list default tidak ikut berubah antar pemanggilan"""
+        load_config(self.path).node_peers.append('127.0.0.1:5001')
+        self.assertEqual(load_config(self.path).node_peers, [])
+
+if __name__ == '__main__':
+    unittest.main()
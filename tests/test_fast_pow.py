@@ -0,0 +1,109 @@
+import unittest
+import hashlib
+import json
+import importlib.util
+from src.core import fast_pow
+
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+HAS_CRYPTO_UTILS = importlib.util.find_spec('src.utils.crypto_utils') is not None
+
+def reference_proof_of_work(block_header, difficulty):
+    """Proof of Work naif dengan serialisasi yang sama seperti crypto_utils.calculate_hash"""
+    nonce = 0
+    while True:
+        block_header['nonce'] = nonce
+        block_hash = hashlib.sha256(json.dumps(block_header, sort_keys=True).encode()).hexdigest()
+        if block_hash.startswith('0' * difficulty):
+            return nonce, block_hash
+        nonce += 1
+
+def make_header():
+    # Prefix lebih dari 64 byte agar midstate benar-benar dipakai
+    return {
+        'index': 7,
+        'previous_hash': 'ab' * 32,
+        'timestamp': 1700000000,
+        'merkle_root': 'cd' * 32,
+        'difficulty': 3,
+        'nonce': 0
+    }
+
+class TestFastPow(unittest.TestCase):
+    def test_split_header(self):
+        """Pengujian prefix + nonce + suffix sama dengan header yang diserialisasi"""
+        header = make_header()
+        prefix, suffix = fast_pow.split_header(header)
+
+        header['nonce'] = 12345
+        self.assertEqual(prefix + b'12345' + suffix, json.dumps(header, sort_keys=True).encode())
+
+    def test_difficulty_target(self):
+        """Pengujian target setara dengan jumlah nol hexadecimal di awal hash"""
+        target = fast_pow.difficulty_target(2)
+        self.assertTrue(bytes.fromhex('00ff' + 'ff' * 30) < target)
+        self.assertFalse(bytes.fromhex('0100' + '00' * 30) < target)
+
+    def test_matches_reference(self):
+        """Pengujian nonce dan hash sama dengan Proof of Work naif"""
+        for difficulty in range(4):
+            header = make_header()
+            expected = reference_proof_of_work(dict(header), difficulty)
+
+            self.assertEqual(fast_pow.proof_of_work(header, difficulty), expected)
+            self.assertEqual(header['nonce'], expected[0])
+
+    def test_strided_search(self):
+        """Pengujian pencarian berselang hanya mencoba nonce di partisinya"""
+        prefix, suffix = fast_pow.split_header(make_header())
+        nonce, _ = fast_pow.find_nonce(prefix, suffix, 2, start=1, stride=3)
+        self.assertEqual(nonce % 3, 1)
+
+    def test_parallel_miner(self):
+        """Pengujian ParallelMiner menghasilkan nonce dan hash yang valid"""
+        miner = fast_pow.ParallelMiner(2)
+        try:
+            for difficulty in (2, 3):
+                header = make_header()
+                nonce, block_hash = miner.proof_of_work(header, difficulty)
+
+                # Worker pertama yang berhasil menang, belum tentu nonce terkecil
+                self.assertEqual(header['nonce'], nonce)
+                self.assertEqual(block_hash, hashlib.sha256(json.dumps(header, sort_keys=True).encode()).hexdigest())
+                self.assertTrue(block_hash.startswith('0' * difficulty))
+        finally:
+            miner.close()
+
+    @unittest.skipUnless(HAS_CRYPTO_UTILS, "src.utils.crypto_utils tidak tersedia")
+    def test_matches_crypto_utils(self):
+        """Pengujian hasil sama dengan crypto_utils.proof_of_work"""
+        from src.utils import crypto_utils
+
+        header = make_header()
+        expected = crypto_utils.proof_of_work(dict(header), 3)
+        self.assertEqual(fast_pow.proof_of_work(header, 3), expected)
+
+@unittest.skipUnless(HAS_NUMBA, "numba tidak terinstal")
+class TestNumbaPow(unittest.TestCase):
+    def test_matches_reference(self):
+        """Pengujian kernel Numba menghasilkan nonce dan hash yang sama"""
+        from src.core import pow_numba
+
+        for difficulty in range(4):
+            header = make_header()
+            expected = reference_proof_of_work(dict(header), difficulty)
+
+            self.assertEqual(pow_numba.proof_of_work(header, difficulty), expected)
+            self.assertEqual(header['nonce'], expected[0])
+
+    def test_matches_fast_pow(self):
+        """Pengujian kernel Numba dan fast_pow sepakat pada pencarian berselang"""
+        from src.core import pow_numba
+
+        prefix, suffix = fast_pow.split_header(make_header())
+        self.assertEqual(
+            pow_numba.find_nonce(prefix, suffix, 3, start=2, stride=5),
+            fast_pow.find_nonce(prefix, suffix, 3, start=2, stride=5)
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+import json
+from src.utils.json_utils import dumps, loads
+
+class TestJsonUtils(unittest.TestCase):
+    def test_round_trip(self):
+        """Pengujian serialisasi dan parse data biasa"""
+        data = {'index': 1, 'hash': '00ab', 'accounts': {'0xa': 50}, 'amount': 1.5}
+        self.assertEqual(loads(dumps(data)), data)
+        self.assertTrue(dumps(data, newline=True).endswith(b'\n'))
+
+    def test_large_integers(self):
+        """Pengujian integer di luar rentang 64-bit tidak hilang presisinya"""
+        data = {'accounts': {'0xa': 10 ** 30, '0xb': -(2 ** 70)}, 'chain': [2 ** 64]}
+
+        encoded = dumps(data, newline=True)
+        self.assertTrue(encoded.endswith(b'\n'))
+        self.assertEqual(json.loads(encoded), data)
+        self.assertEqual(loads(encoded), data)
+        self.assertIsInstance(loads(encoded)['accounts']['0xa'], int)
+
+    def test_digits_inside_strings(self):
+        """Pengujian string berisi angka panjang tetap diparse dengan benar"""
+        data = {'hash': '0' * 64, 'data': '12345678901234567890123'}
+        self.assertEqual(loads(dumps(data)), data)
+
+    def test_memoryview(self):
+        """Pengujian parse langsung dari memoryview (mmap)"""
+        encoded = dumps({'balance': 10 ** 25})
+        self.assertEqual(loads(memoryview(encoded)), {'balance': 10 ** 25})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import os
+import sys
+import signal
+import shutil
+import tempfile
+import subprocess
+import importlib.util
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HAS_CORE = importlib.util.find_spec('src.core.block') is not None
+
+@unittest.skipUnless(HAS_CORE, "src.core.block tidak tersedia")
+class TestMineShutdown(unittest.TestCase):
+    def setUp(self):
+        # Direktori sementara untuk file blockchain
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def run_and_terminate(self, args, command, ready):
+        """
+        Menjalankan mine.py lalu mengirim SIGTERM ke seluruh process group
+        setelah baris `ready` muncul di stdout.
+        """
+        blockchain_file = os.path.join(self.tmpdir, 'blockchain.json')
+
+        # Jalankan di session baru agar SIGTERM dapat dikirim ke process group,
+        # seperti systemd (KillMode=control-group) dan timeout
+        process = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, 'mine.py'),
+             '--blockchain-file', blockchain_file,
+             '--workers', '2'] + args,
+            cwd=ROOT,
+            env=dict(os.environ, PYTHONUNBUFFERED='1'),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True
+        )
+
+        try:
+            # Handler SIGTERM sudah terpasang sebelum perintah pertama diproses
+            if command:
+                process.stdin.write(command)
+                process.stdin.flush()
+
+            for line in process.stdout:
+                if line.startswith(ready):
+                    break
+            else:
+                self.fail("mine.py berhenti sebelum siap: " + process.stderr.read().decode())
+
+            os.killpg(process.pid, signal.SIGTERM)
+
+            # Proses harus keluar sendiri tanpa SIGKILL
+            _, stderr = process.communicate(timeout=30)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.communicate()
+            self.fail("mine.py tidak berhenti setelah SIGTERM")
+
+        self.assertEqual(process.returncode, 0, stderr.decode())
+
+        # Blockchain tersimpan saat keluar
+        self.assertTrue(os.path.exists(blockchain_file))
+
+    def test_sigterm_while_idle(self):
+        """Pengujian SIGTERM ke process group saat pool worker menganggur"""
+        self.run_and_terminate(['--serve'], b'balance 0xminer\n', b'Saldo:')
+
+    def test_sigterm_while_mining(self):
+        """Pengujian SIGTERM ke process group saat worker mencari nonce"""
+        self.run_and_terminate(['--address', '0xminer', '--blocks', '1000000'], None, b'Mining blok')
+
+    def test_sigterm_while_auto_mining(self):
+        """Pengujian SIGTERM ke process group dalam mode --auto"""
+        self.run_and_terminate(['--address', '0xminer', '--auto'], None, b'Blok berhasil')
+
+if __name__ == '__main__':
+    unittest.main()